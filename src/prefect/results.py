@@ -1,10 +1,15 @@
 import abc
+import asyncio
 import inspect
 import os
+import re
+import secrets
 import socket
+import string
+import sys
 import threading
 import uuid
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -13,6 +18,8 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
+    List,
     Optional,
     Tuple,
     Type,
@@ -21,8 +28,9 @@ from typing import (
 )
 from uuid import UUID
 
+import orjson
 import pendulum
-from cachetools import LRUCache
+from cachetools import LRUCache, TTLCache
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -55,8 +63,15 @@ from prefect.filesystems import (
 )
 from prefect.locking.protocol import LockManager
 from prefect.logging import get_logger
-from prefect.serializers import PickleSerializer, Serializer
+from prefect.serializers import (
+    CompressedJSONSerializer,
+    CompressedPickleSerializer,
+    CompressedSerializer,
+    PickleSerializer,
+    Serializer,
+)
 from prefect.settings import (
+    PREFECT_API_URL,
     PREFECT_DEFAULT_RESULT_STORAGE_BLOCK,
     PREFECT_LOCAL_STORAGE_PATH,
     PREFECT_RESULTS_DEFAULT_SERIALIZER,
@@ -64,7 +79,7 @@ from prefect.settings import (
     PREFECT_TASK_SCHEDULING_DEFAULT_STORAGE_BLOCK,
 )
 from prefect.utilities.annotations import NotSet
-from prefect.utilities.asyncutils import sync_compatible
+from prefect.utilities.asyncutils import run_sync_in_worker_thread, sync_compatible
 from prefect.utilities.pydantic import get_dispatch_key, lookup_type, register_base_type
 
 if TYPE_CHECKING:
@@ -76,10 +91,23 @@ if TYPE_CHECKING:
 ResultStorage = Union[WritableFileSystem, str]
 ResultSerializer = Union[Serializer, str]
 LITERAL_TYPES = {type(None), bool, UUID}
+# Results larger than this (as reported by `sys.getsizeof`) are serialized in a worker
+# thread when persisted
+_SERIALIZE_IN_THREAD_MIN_SIZE = 256 * 1024
+# Serializers that always produce base64 output, which can be embedded in a JSON string
+# without escaping; subclasses are not included since they may override `dumps`
+_BASE64_SERIALIZER_TYPES = frozenset(
+    {
+        PickleSerializer,
+        CompressedSerializer,
+        CompressedPickleSerializer,
+        CompressedJSONSerializer,
+    }
+)
 
 
 def DEFAULT_STORAGE_KEY_FN():
-    return uuid.uuid4().hex
+    return secrets.token_hex(16)
 
 
 logger = get_logger("results")
@@ -88,6 +116,36 @@ R = TypeVar("R")
 
 _default_storages: Dict[Tuple[str, str], WritableFileSystem] = {}
 
+# Storage blocks loaded by slug are cached for a short time so that each flow and
+# task run does not need to load the same block document from the API; entries are
+# keyed by the API URL as well since the same slug can refer to different blocks
+# in different workspaces
+_loaded_storage_blocks: TTLCache = TTLCache(maxsize=128, ttl=300)
+_loaded_storage_blocks_lock = threading.Lock()
+# In-flight loads are tracked per event loop since tasks cannot be awaited across loops
+_storage_block_loads: Dict[
+    Tuple[Tuple[Optional[str], str], asyncio.AbstractEventLoop],
+    "asyncio.Task[WritableFileSystem]",
+] = {}
+
+
+def _compute_holder_prefix() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:"
+
+
+# The hostname and PID are fixed for the lifetime of a process, so the holder
+# prefix is computed once and only refreshed in forked children
+_holder_prefix = _compute_holder_prefix()
+
+
+def _reset_holder_prefix() -> None:
+    global _holder_prefix
+    _holder_prefix = _compute_holder_prefix()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_holder_prefix)
+
 
 @sync_compatible
 async def get_default_result_storage() -> WritableFileSystem:
@@ -99,8 +157,9 @@ async def get_default_result_storage() -> WritableFileSystem:
 
     cache_key = (str(default_block), str(basepath))
 
-    if cache_key in _default_storages:
-        return _default_storages[cache_key]
+    storage = _default_storages.get(cache_key)
+    if storage is not None:
+        return storage
 
     if default_block is not None:
         storage = await resolve_result_storage(default_block)
@@ -120,9 +179,6 @@ async def resolve_result_storage(
     Resolve one of the valid `ResultStorage` input types into a saved block
     document id and an instance of the block.
     """
-    from prefect.client.orchestration import get_client
-
-    client = get_client()
     if isinstance(result_storage, Block):
         storage_block = result_storage
 
@@ -134,10 +190,14 @@ async def resolve_result_storage(
     elif isinstance(result_storage, Path):
         storage_block = LocalFileSystem(basepath=str(result_storage))
     elif isinstance(result_storage, str):
-        storage_block = await Block.load(result_storage, client=client)
+        storage_block = await _load_storage_block(result_storage)
         storage_block_id = storage_block._block_document_id
         assert storage_block_id is not None, "Loaded storage blocks must have ids"
     elif isinstance(result_storage, UUID):
+        from prefect.client.orchestration import get_client
+
+        # Only create a client for inputs that need to be read from the API
+        client = get_client()
         block_document = await client.read_block_document(result_storage)
         storage_block = Block._from_block_document(block_document)
     else:
@@ -149,6 +209,42 @@ async def resolve_result_storage(
     return storage_block
 
 
+async def _load_storage_block(slug: str) -> WritableFileSystem:
+    loop = asyncio.get_running_loop()
+    cache_key = (PREFECT_API_URL.value(), slug)
+    load_key = (cache_key, loop)
+
+    with _loaded_storage_blocks_lock:
+        storage_block = _loaded_storage_blocks.get(cache_key)
+        if storage_block is not None:
+            return storage_block
+
+        # Concurrent loads of the same block share a single request to the API
+        load = _storage_block_loads.get(load_key)
+        if load is None:
+            load = loop.create_task(_load_and_cache_storage_block(cache_key))
+            _storage_block_loads[load_key] = load
+
+            def forget_load(_: "asyncio.Task[WritableFileSystem]") -> None:
+                with _loaded_storage_blocks_lock:
+                    _storage_block_loads.pop(load_key, None)
+
+            load.add_done_callback(forget_load)
+
+    # Shield the shared load so that a cancelled caller does not cancel it for others
+    return await asyncio.shield(load)
+
+
+async def _load_and_cache_storage_block(
+    cache_key: Tuple[Optional[str], str],
+) -> WritableFileSystem:
+    _, slug = cache_key
+    storage_block = await Block.load(slug)
+    with _loaded_storage_blocks_lock:
+        _loaded_storage_blocks[cache_key] = storage_block
+    return storage_block
+
+
 def resolve_serializer(serializer: ResultSerializer) -> Serializer:
     """
     Resolve one of the valid `ResultSerializer` input types into a serializer
@@ -183,7 +279,19 @@ def get_default_result_serializer() -> Serializer:
     """
     Generate a default file system for result storage.
     """
-    return resolve_serializer(PREFECT_RESULTS_DEFAULT_SERIALIZER.value())
+    # Keyed by the setting value so that setting overrides are still respected
+    return _get_serializer(PREFECT_RESULTS_DEFAULT_SERIALIZER.value())
+
+
+def _get_serializer(serializer_type: str) -> Serializer:
+    # Serializers are mutable models, so each caller gets its own copy; copying is
+    # still much cheaper than validating a new model from the type string
+    return _resolve_serializer_by_type(serializer_type).model_copy()
+
+
+@lru_cache()
+def _resolve_serializer_by_type(serializer_type: str) -> Serializer:
+    return resolve_serializer(serializer_type)
 
 
 def get_default_persist_setting() -> bool:
@@ -215,8 +323,45 @@ def should_persist_result() -> bool:
 def _format_user_supplied_storage_key(key: str) -> str:
     # Note here we are pinning to task runs since flow runs do not support storage keys
     # yet; we'll need to split logic in the future or have two separate functions
-    runtime_vars = {key: getattr(prefect.runtime, key) for key in dir(prefect.runtime)}
-    return key.format(**runtime_vars, parameters=prefect.runtime.task_run.parameters)
+    return _compile_storage_key_template(key)()
+
+
+@lru_cache(maxsize=256)
+def _compile_storage_key_template(key: str) -> Callable[[], str]:
+    """
+    Compile a user supplied storage key template into a function that formats it
+    with the current runtime values.
+
+    The template is only parsed once; each call resolves just the runtime
+    attributes that the template references.
+    """
+    if "{" not in key and "}" not in key:
+        return lambda: key
+
+    try:
+        fields = list(string.Formatter().parse(key))
+    except ValueError:
+        # Malformed templates raise when the key is formatted, as `str.format` would
+        return key.format
+
+    names = []
+    for _, field_name, _, _ in fields:
+        if not field_name:
+            continue
+        name = re.split(r"[.\[]", field_name, maxsplit=1)[0]
+        if name not in names:
+            names.append(name)
+
+    def format_key() -> str:
+        runtime_vars = {}
+        for name in names:
+            if name == "parameters":
+                runtime_vars[name] = prefect.runtime.task_run.parameters
+            elif hasattr(prefect.runtime, name):
+                runtime_vars[name] = getattr(prefect.runtime, name)
+        return key.format(**runtime_vars)
+
+    return format_key
 
 
 T = TypeVar("T")
@@ -366,11 +511,20 @@ class ResultStore(BaseModel):
         Returns:
             str: A unique identifier string.
         """
-        hostname = socket.gethostname()
-        pid = os.getpid()
-        thread_name = threading.current_thread().name
-        thread_id = threading.get_ident()
-        return f"{hostname}:{pid}:{thread_id}:{thread_name}"
+        thread = threading.current_thread()
+        return f"{_holder_prefix}{thread.ident}:{thread.name}"
+
+    def _resolve_holder(self, holder: Optional[str] = None) -> Optional[str]:
+        """
+        Resolve the holder to use for lock checks.
+
+        A default holder is only generated when a lock manager is configured. It
+        is generated here rather than in the internal implementations because
+        synchronous calls may run them on a different thread.
+        """
+        if not holder and self.lock_manager is not None:
+            return self.generate_default_holder()
+        return holder
 
     @sync_compatible
     async def _exists(self, key: str) -> bool:
@@ -437,7 +591,7 @@ class ResultStore(BaseModel):
         return await self._exists(key=key, _sync=False)
 
     @sync_compatible
-    async def _read(self, key: str, holder: str) -> "ResultRecord":
+    async def _read(self, key: str, holder: Optional[str] = None) -> "ResultRecord":
         """
         Read a result record from storage.
 
@@ -455,12 +609,22 @@ class ResultStore(BaseModel):
         if self.lock_manager is not None and not self.is_lock_holder(key, holder):
             await self.await_for_lock(key)
 
-        if key in self.cache:
-            return self.cache[key]
-
         if self.result_storage is None:
             self.result_storage = await get_default_result_storage()
 
+        if self.cache_result_in_memory:
+            # Cached records are keyed by their resolved path when the storage is not
+            # saved so that relative and absolute keys for the same record match
+            if self.result_storage_block_id is None and hasattr(
+                self.result_storage, "_resolve_path"
+            ):
+                cache_key = str(self.result_storage._resolve_path(key))
+            else:
+                cache_key = key
+
+            if cache_key in self.cache:
+                return self.cache[cache_key]
+
         if self.metadata_storage is not None:
             metadata_content = await self.metadata_storage.read_path(key)
             metadata = ResultRecordMetadata.load_bytes(metadata_content)
@@ -478,13 +642,6 @@ class ResultStore(BaseModel):
             )
 
         if self.cache_result_in_memory:
-            if self.result_storage_block_id is None and hasattr(
-                self.result_storage, "_resolve_path"
-            ):
-                cache_key = str(self.result_storage._resolve_path(key))
-            else:
-                cache_key = key
-
             self.cache[cache_key] = result_record
         return result_record
 
@@ -503,7 +660,7 @@ class ResultStore(BaseModel):
         Returns:
             A result record.
         """
-        holder = holder or self.generate_default_holder()
+        holder = self._resolve_holder(holder)
         return self._read(key=key, holder=holder, _sync=True)
 
     async def aread(
@@ -521,9 +678,76 @@ class ResultStore(BaseModel):
         Returns:
             A result record.
         """
-        holder = holder or self.generate_default_holder()
+        holder = self._resolve_holder(holder)
         return await self._read(key=key, holder=holder, _sync=False)
 
+    async def _read_many(
+        self,
+        keys: Iterable[str],
+        holder: Optional[str],
+        max_concurrency: int,
+        skip_errors: bool,
+    ) -> List[Optional["ResultRecord"]]:
+        """
+        Read multiple result records concurrently, issuing at most `max_concurrency`
+        reads at once. If `skip_errors` is set, records that cannot be read are
+        returned as `None` instead of raising.
+        """
+        holder = self._resolve_holder(holder)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def read_key(key: str) -> Optional["ResultRecord"]:
+            async with semaphore:
+                try:
+                    return await self._read(key=key, holder=holder, _sync=False)
+                except Exception:
+                    if not skip_errors:
+                        raise
+                    logger.debug("Failed to read result record %r", key, exc_info=True)
+                    return None
+
+        return list(await asyncio.gather(*(read_key(key) for key in keys)))
+
+    async def aread_many(
+        self,
+        keys: Iterable[str],
+        holder: Optional[str] = None,
+        max_concurrency: int = 8,
+    ) -> List["ResultRecord"]:
+        """
+        Read multiple result records from storage concurrently.
+
+        Args:
+            keys: The keys to read the result records from.
+            holder: The holder of the lock if a lock was set on the records.
+            max_concurrency: The maximum number of reads to issue at once.
+
+        Returns:
+            A list of result records in the same order as the given keys.
+        """
+        return await self._read_many(
+            keys, holder=holder, max_concurrency=max_concurrency, skip_errors=False
+        )
+
+    async def aprefetch(self, keys: Iterable[str], max_concurrency: int = 8) -> None:
+        """
+        Read multiple result records concurrently so that subsequent reads of the
+        same keys are served from the in-memory cache.
+
+        Has no effect if the store does not cache results in memory. Records that
+        cannot be read are skipped, and errors are raised when they are read later.
+
+        Args:
+            keys: The keys to read the result records from.
+            max_concurrency: The maximum number of reads to issue at once.
+        """
+        if not self.cache_result_in_memory:
+            return
+
+        await self._read_many(
+            keys, holder=None, max_concurrency=max_concurrency, skip_errors=True
+        )
+
     def create_result_record(
         self,
         obj: Any,
@@ -575,7 +799,7 @@ class ResultStore(BaseModel):
             expiration: The expiration time for the result record.
             holder: The holder of the lock if a lock was set on the record.
         """
-        holder = holder or self.generate_default_holder()
+        holder = self._resolve_holder(holder)
         result_record = self.create_result_record(
             key=key, obj=obj, expiration=expiration
         )
@@ -600,7 +824,7 @@ class ResultStore(BaseModel):
             expiration: The expiration time for the result record.
             holder: The holder of the lock if a lock was set on the record.
         """
-        holder = holder or self.generate_default_holder()
+        holder = self._resolve_holder(holder)
         return await self.apersist_result_record(
             result_record=self.create_result_record(
                 key=key, obj=obj, expiration=expiration
@@ -609,7 +833,9 @@ class ResultStore(BaseModel):
         )
 
     @sync_compatible
-    async def _persist_result_record(self, result_record: "ResultRecord", holder: str):
+    async def _persist_result_record(
+        self, result_record: "ResultRecord", holder: Optional[str] = None
+    ):
         """
         Persist a result record to storage.
 
@@ -643,20 +869,33 @@ class ResultStore(BaseModel):
         if self.result_storage is None:
             self.result_storage = await get_default_result_storage()
 
-        # If metadata storage is configured, write result and metadata separately
+        # If metadata storage is configured, the result and metadata are written
+        # separately; otherwise they are written together
+        serialize = (
+            result_record.serialize_result
+            if self.metadata_storage is not None
+            else result_record.serialize
+        )
+        # Serializing large results can block the event loop for a noticeable amount
+        # of time, so it is done in a worker thread instead
+        if sys.getsizeof(result_record.result, 0) > _SERIALIZE_IN_THREAD_MIN_SIZE:
+            content = await run_sync_in_worker_thread(serialize)
+        else:
+            content = serialize()
+
         if self.metadata_storage is not None:
+            # The metadata is written last since its presence marks the record as
+            # existing
             await self.result_storage.write_path(
-                result_record.metadata.storage_key,
-                content=result_record.serialize_result(),
+                result_record.metadata.storage_key, content=content
             )
             await self.metadata_storage.write_path(
                 base_key,
                 content=result_record.serialize_metadata(),
             )
-        # Otherwise, write the result metadata and result together
         else:
             await self.result_storage.write_path(
-                result_record.metadata.storage_key, content=result_record.serialize()
+                result_record.metadata.storage_key, content=content
             )
 
         if self.cache_result_in_memory:
@@ -671,7 +910,7 @@ class ResultStore(BaseModel):
         Args:
             result_record: The result record to persist.
         """
-        holder = holder or self.generate_default_holder()
+        holder = self._resolve_holder(holder)
         return self._persist_result_record(
             result_record=result_record, holder=holder, _sync=True
         )
@@ -685,7 +924,7 @@ class ResultStore(BaseModel):
         Args:
             result_record: The result record to persist.
         """
-        holder = holder or self.generate_default_holder()
+        holder = self._resolve_holder(holder)
         return await self._persist_result_record(
             result_record=result_record, holder=holder, _sync=False
         )
@@ -930,7 +1169,11 @@ class ResultRecordMetadata(BaseModel):
         Returns:
             bytes: the serialized metadata
         """
-        return self.model_dump_json(serialize_as_any=True).encode()
+        # Serialize straight to bytes rather than encoding an intermediate `str`;
+        # `by_alias` is explicit since its default differs across pydantic versions
+        return self.__pydantic_serializer__.to_json(
+            self, by_alias=False, serialize_as_any=True
+        )
 
     @classmethod
     def load_bytes(cls, data: bytes) -> "ResultRecordMetadata":
@@ -1020,7 +1263,10 @@ class ResultRecord(BaseModel, Generic[R]):
     @model_validator(mode="before")
     @classmethod
     def coerce_old_format(cls, value: Any):
-        if isinstance(value, dict):
+        # records in the current format are passed through without any rewriting
+        if isinstance(value, dict) and not (
+            len(value) == 2 and "metadata" in value and "result" in value
+        ):
             if "data" in value:
                 value["result"] = value.pop("data")
             if "metadata" not in value:
@@ -1071,10 +1317,25 @@ class ResultRecord(BaseModel, Generic[R]):
             bytes: the serialized record
 
         """
-        return (
-            self.model_copy(update={"result": self.serialize_result()})
-            .model_dump_json(serialize_as_any=True)
-            .encode()
+        serialized_result = self.serialize_result()
+        if (
+            isinstance(serialized_result, bytes)
+            and type(self.serializer) in _BASE64_SERIALIZER_TYPES
+        ):
+            # base64 never needs escaping so it is embedded without another pass
+            result_parts = [b'"', serialized_result, b'"']
+        else:
+            if isinstance(serialized_result, bytes):
+                serialized_result = serialized_result.decode()
+            result_parts = [orjson.dumps(serialized_result)]
+
+        # Assemble the document directly rather than copying the record to swap in the
+        # serialized result; `orjson` is used to encode the result since it is faster
+        # than pydantic for the large strings that serialized results tend to be
+        return b"".join(
+            [b'{"metadata":', self.serialize_metadata(), b',"result":']
+            + result_parts
+            + [b"}"]
         )
 
     @classmethod
@@ -1135,6 +1396,20 @@ class ResultRecord(BaseModel, Generic[R]):
         return self.metadata == other.metadata and self.result == other.result
 
 
+# The dispatch key and registered type for a given class and type string do not change
+# once classes are defined, so they are resolved once rather than on every construction
+@lru_cache(maxsize=None)
+def _get_result_type_string(cls: Type["BaseResult"]) -> str:
+    return get_dispatch_key(cls) if cls is not BaseResult else "__base__"
+
+
+@lru_cache(maxsize=None)
+def _lookup_result_type(
+    cls: Type["BaseResult"], type_string: str
+) -> Type["BaseResult"]:
+    return lookup_type(cls, dispatch_key=type_string)
+
+
 @deprecated.deprecated_class(
     start_date="Sep 2024", end_date="Nov 2024", help="Use `ResultRecord` instead."
 )
@@ -1144,16 +1419,13 @@ class BaseResult(BaseModel, abc.ABC, Generic[R]):
     type: str
 
     def __init__(self, **data: Any) -> None:
-        type_string = (
-            get_dispatch_key(self) if type(self) is not BaseResult else "__base__"
-        )
-        data.setdefault("type", type_string)
+        data.setdefault("type", _get_result_type_string(type(self)))
         super().__init__(**data)
 
     def __new__(cls: Type[Self], **kwargs) -> Self:
         if "type" in kwargs:
             try:
-                subcls = lookup_type(cls, dispatch_key=kwargs["type"])
+                subcls = _lookup_result_type(cls, kwargs["type"])
             except KeyError as exc:
                 raise ValueError(f"Invalid type: {kwargs['type']}") from exc
             return super().__new__(subcls)
@@ -1188,6 +1460,19 @@ class BaseResult(BaseModel, abc.ABC, Generic[R]):
         return cls.__name__ if isinstance(default, PydanticUndefinedType) else default
 
 
+def _resolve_block_path(storage_block: Any, key: str) -> Any:
+    return storage_block._resolve_path(key)
+
+
+def _resolve_remote_block_path(storage_block: Any, key: str) -> Any:
+    return storage_block._remote_file_system._resolve_path(key)
+
+
+# How to resolve a path for a storage block only depends on its type, so the resolver
+# is chosen once per type instead of probing attributes on every created result
+_path_resolvers: Dict[type, Optional[Callable[[Any, str], Any]]] = {}
+
+
 @deprecated.deprecated_class(
     start_date="Sep 2024", end_date="Nov 2024", help="Use `ResultRecord` instead."
 )
@@ -1249,8 +1534,10 @@ class PersistedResult(BaseResult):
         """
         Retrieve the data and deserialize it into the original object.
         """
-        if self.has_cached_object() and not ignore_cache:
-            return self._cache
+        # private attributes are looked up through `__getattr__`, so read it once
+        cached = self._cache
+        if cached is not NotSet and not ignore_cache:
+            return cached
 
         result_store_kwargs = {}
         if self._serializer:
@@ -1273,10 +1560,19 @@ class PersistedResult(BaseResult):
         defer to the block in the future
         """
 
-        if hasattr(storage_block, "_resolve_path"):
-            return storage_block._resolve_path(key)
-        if hasattr(storage_block, "_remote_file_system"):
-            return storage_block._remote_file_system._resolve_path(key)
+        block_type = type(storage_block)
+        resolver = _path_resolvers.get(block_type, NotSet)
+        if resolver is NotSet:
+            if hasattr(storage_block, "_resolve_path"):
+                resolver = _resolve_block_path
+            elif hasattr(storage_block, "_remote_file_system"):
+                resolver = _resolve_remote_block_path
+            else:
+                resolver = None
+            _path_resolvers[block_type] = resolver
+
+        if resolver is not None:
+            return resolver(storage_block, key)
 
     @sync_compatible
     @inject_client
@@ -1302,7 +1598,7 @@ class PersistedResult(BaseResult):
         serializer = self._serializer
         if serializer is None:
             # this could error if the serializer requires kwargs
-            serializer = Serializer(type=self.serializer_type)
+            serializer = _get_serializer(self.serializer_type)
 
         result_store = ResultStore(
             result_storage=storage_block,
@@ -135,7 +135,9 @@ class PickleSerializer(Serializer):
     def dumps(self, obj: Any) -> bytes:
         pickler = from_qualified_name(self.picklelib)
         blob = pickler.dumps(obj)
-        return base64.encodebytes(blob)
+        # `encodebytes` encodes in 57 byte chunks from Python which is slow for large
+        # pickles; a single unwrapped pass is still readable by `decodebytes`
+        return base64.b64encode(blob)
 
     def loads(self, blob: bytes) -> Any:
         pickler = from_qualified_name(self.picklelib)
@@ -229,7 +231,7 @@ class CompressedSerializer(Serializer):
     def dumps(self, obj: Any) -> bytes:
         blob = self.serializer.dumps(obj)
         compressor = from_qualified_name(self.compressionlib)
-        return base64.encodebytes(compressor.compress(blob))
+        return base64.b64encode(compressor.compress(blob))
 
     def loads(self, blob: bytes) -> Any:
         compressor = from_qualified_name(self.compressionlib)
@@ -33,8 +33,10 @@ async def local_filesystem(tmp_path):
 @pytest.fixture(autouse=True)
 async def clear_cached_filesystems():
     prefect.results._default_storages.clear()
+    prefect.results._loaded_storage_blocks.clear()
     yield
     prefect.results._default_storages.clear()
+    prefect.results._loaded_storage_blocks.clear()
 
 
 # Key-value storage API ----------------------------------------------------------------
@@ -4,12 +4,14 @@ import uuid
 import pendulum
 import pytest
 
+from prefect._internal.compatibility.deprecated import PrefectDeprecationWarning
 from prefect.filesystems import LocalFileSystem
 from prefect.results import (
     DEFAULT_STORAGE_KEY_FN,
     PersistedResult,
     ResultRecord,
     ResultRecordMetadata,
+    ResultStore,
 )
 from prefect.serializers import JSONSerializer, PickleSerializer
 
@@ -47,6 +49,17 @@ async def test_result_reference_create_and_get(cache_object, storage_block):
     assert result.has_cached_object() == cache_object
 
 
+async def test_result_reference_create_warns_deprecation(storage_block):
+    with pytest.warns(PrefectDeprecationWarning, match="PersistedResult"):
+        await PersistedResult.create(
+            "test",
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=JSONSerializer(),
+        )
+
+
 async def test_result_reference_create_uses_storage(storage_block):
     result = await PersistedResult.create(
         "test",
@@ -239,6 +252,19 @@ async def test_lifecycle_of_deferred_persistence(storage_block):
     assert obj == "test-defer"
 
 
+async def test_new_references_read_overwritten_results(storage_block):
+    for value in ["v1", "v2"]:
+        store = ResultStore(result_storage=storage_block, serializer=JSONSerializer())
+        await store.awrite(obj=value, key="overwritten-path")
+
+        reference = PersistedResult(
+            serializer_type="json",
+            storage_block_id=storage_block._block_document_id,
+            storage_key="overwritten-path",
+        )
+        assert await reference.get() == value
+
+
 async def test_read_old_format_into_result_record():
     old_blob = {
         "serializer": {
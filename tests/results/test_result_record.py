@@ -1,10 +1,19 @@
+import json
+
 import pytest
-from pydantic import ValidationError
+from pydantic import Field, ValidationError
 
 from prefect.filesystems import NullFileSystem
 from prefect.results import ResultRecord, ResultRecordMetadata, ResultStore
-from prefect.serializers import JSONSerializer
+from prefect.serializers import (
+    CompressedPickleSerializer,
+    CompressedSerializer,
+    JSONSerializer,
+    PickleSerializer,
+    Serializer,
+)
 from prefect.settings import PREFECT_LOCAL_STORAGE_PATH
+from prefect.utilities.dispatch import get_registry_for_type
 
 
 class TestResultRecord:
@@ -20,6 +29,29 @@ class TestResultRecord:
         deserialized = ResultRecord.deserialize(serialized)
         assert deserialized.result == "The results are in..."
 
+    @pytest.mark.parametrize(
+        "serializer",
+        [
+            JSONSerializer(),
+            PickleSerializer(),
+            CompressedSerializer(serializer="json"),
+            CompressedPickleSerializer(),
+        ],
+        ids=["json", "pickle", "compressed-json", "compressed-pickle"],
+    )
+    def test_serialize_matches_model_dump(self, serializer):
+        record = ResultRecord(
+            result={"message": 'The "results" are in...'},
+            metadata=ResultRecordMetadata(
+                storage_key="my-storage-key", serializer=serializer
+            ),
+        )
+
+        expected = record.model_copy(
+            update={"result": record.serialize_result()}
+        ).model_dump_json(serialize_as_any=True)
+        assert json.loads(record.serialize()) == json.loads(expected)
+
     def test_deserialize_with_result_only(self):
         serialized = JSONSerializer().dumps("The results are in...")
 
@@ -58,3 +90,37 @@ class TestResultRecord:
             )
             == "The results are in..."
         )
+
+
+class TestResultRecordMetadata:
+    @pytest.fixture(autouse=True)
+    def restore_dispatch_registry(self):
+        # Clears serializers defined in tests below to prevent warnings on collision
+        before = get_registry_for_type(Serializer).copy()
+
+        yield
+
+        registry = get_registry_for_type(Serializer)
+        registry.clear()
+        registry.update(before)
+
+    def test_dump_bytes_does_not_use_field_aliases(self):
+        class AliasedSerializer(Serializer):
+            type: str = "aliased-test"
+
+            level: int = Field(default=1, serialization_alias="compression_level")
+
+            def dumps(self, obj):
+                pass
+
+            def loads(self, obj):
+                pass
+
+        metadata = ResultRecordMetadata(
+            storage_key="my-storage-key", serializer=AliasedSerializer(level=5)
+        )
+
+        dumped = metadata.dump_bytes()
+        assert dumped == metadata.model_dump_json(serialize_as_any=True).encode()
+        assert json.loads(dumped)["serializer"]["level"] == 5
+        assert ResultRecordMetadata.load_bytes(dumped).serializer.level == 5
@@ -1,18 +1,30 @@
+import asyncio
+import os
+import pickle
+import socket
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock
+
 import pytest
 
 import prefect.exceptions
 import prefect.results
 from prefect import flow, task
+from prefect.blocks.core import Block
 from prefect.context import FlowRunContext, get_run_context
 from prefect.filesystems import LocalFileSystem
 from prefect.locking.memory import MemoryLockManager
 from prefect.results import (
     ResultRecord,
     ResultStore,
+    get_default_result_serializer,
+    resolve_result_storage,
     should_persist_result,
 )
 from prefect.serializers import JSONSerializer, PickleSerializer
 from prefect.settings import (
+    PREFECT_API_URL,
     PREFECT_LOCAL_STORAGE_PATH,
     PREFECT_RESULTS_DEFAULT_SERIALIZER,
     PREFECT_RESULTS_PERSIST_BY_DEFAULT,
@@ -74,6 +86,20 @@ def test_root_flow_default_result_serializer_can_be_overriden_by_setting():
     assert result_store.serializer == JSONSerializer()
 
 
+def test_default_result_serializer_is_not_shared():
+    serializer = get_default_result_serializer()
+    assert serializer == get_default_result_serializer()
+    assert serializer is not get_default_result_serializer()
+
+    serializer.picklelib = "pickle"
+    assert get_default_result_serializer() == DEFAULT_SERIALIZER()
+
+    with temporary_settings({PREFECT_RESULTS_DEFAULT_SERIALIZER: "json"}):
+        assert get_default_result_serializer() == JSONSerializer()
+
+    assert get_default_result_serializer() == DEFAULT_SERIALIZER()
+
+
 def test_root_flow_default_persist_result_can_be_overriden_by_setting():
     @flow
     def foo():
@@ -721,6 +747,18 @@ async def test_result_store_from_task_with_no_flow_run_context(options, expected
     assert_blocks_equal(result_store.result_storage, DEFAULT_STORAGE())
 
 
+@pytest.mark.parametrize("key", ["static-key", "{parameters[x]}-key"])
+async def test_result_store_from_task_with_storage_key_is_picklable(key):
+    @task(result_storage_key=key)
+    def my_task(x):
+        pass
+
+    result_store = await ResultStore().update_for_task(task=my_task)
+
+    loaded = pickle.loads(pickle.dumps(result_store.storage_key_fn))
+    assert loaded.args == (key,)
+
+
 @pytest.mark.parametrize("persist_result", [True, False])
 async def test_result_store_from_task_loads_persist_result_from_flow_store(
     persist_result,
@@ -800,6 +838,21 @@ async def test_result_store_exists_with_metadata_storage(tmp_path):
     assert not result_store.exists(key=key)
 
 
+async def test_result_store_failed_result_write_does_not_write_metadata(tmp_path):
+    # A file in place of the result directory makes the result write fail
+    (tmp_path / "results").write_text("not a directory")
+    metadata_storage = LocalFileSystem(basepath=tmp_path / "metadata")
+    result_storage = LocalFileSystem(basepath=tmp_path / "results")
+    result_store = ResultStore(
+        metadata_storage=metadata_storage, result_storage=result_storage
+    )
+
+    with pytest.raises(OSError):
+        await result_store.awrite(key="test", obj="test")
+    assert not (tmp_path / "metadata" / "test").exists()
+    assert not await result_store.aexists(key="test")
+
+
 async def test_result_store_exists_with_no_metadata_storage(tmp_path):
     result_storage = LocalFileSystem(basepath=tmp_path / "results")
     result_store = ResultStore(result_storage=result_storage)
@@ -816,6 +869,195 @@ async def test_result_store_exists_with_no_metadata_storage(tmp_path):
     assert not result_store.exists(key=key)
 
 
+@pytest.mark.parametrize("result_storage", [LocalFileSystem(), Path("results")])
+async def test_resolve_result_storage_does_not_create_client_for_local_inputs(
+    result_storage, monkeypatch
+):
+    def fail():
+        raise AssertionError("A client should not be created")
+
+    monkeypatch.setattr("prefect.client.orchestration.get_client", fail)
+    assert isinstance(await resolve_result_storage(result_storage), LocalFileSystem)
+
+
+async def test_resolve_result_storage_caches_blocks_loaded_by_slug(
+    tmp_path, monkeypatch
+):
+    storage = LocalFileSystem(basepath=tmp_path)
+    await storage.save("cached-storage")
+
+    load = AsyncMock(return_value=storage)
+    monkeypatch.setattr(Block, "load", load)
+
+    first = await resolve_result_storage("local-file-system/cached-storage")
+    second = await resolve_result_storage("local-file-system/cached-storage")
+
+    assert first is second is storage
+    load.assert_awaited_once()
+
+
+async def test_resolve_result_storage_caches_blocks_per_api_url(
+    tmp_path, monkeypatch
+):
+    storage = LocalFileSystem(basepath=tmp_path)
+    await storage.save("cached-storage")
+
+    load = AsyncMock(return_value=storage)
+    monkeypatch.setattr(Block, "load", load)
+
+    await resolve_result_storage("local-file-system/cached-storage")
+    with temporary_settings({PREFECT_API_URL: "http://other-workspace.test/api"}):
+        await resolve_result_storage("local-file-system/cached-storage")
+
+    assert load.await_count == 2
+
+
+async def test_resolve_result_storage_shares_concurrent_loads_by_slug(
+    tmp_path, monkeypatch
+):
+    storage = LocalFileSystem(basepath=tmp_path)
+    await storage.save("shared-storage")
+
+    async def slow_load(*args, **kwargs):
+        await asyncio.sleep(0.1)
+        return storage
+
+    load = AsyncMock(side_effect=slow_load)
+    monkeypatch.setattr(Block, "load", load)
+
+    results = await asyncio.gather(
+        *(resolve_result_storage("local-file-system/shared-storage") for _ in range(5))
+    )
+
+    assert all(result is storage for result in results)
+    load.assert_awaited_once()
+
+
+async def test_result_store_read_many(tmp_path):
+    result_storage = LocalFileSystem(basepath=tmp_path / "results")
+    store = ResultStore(result_storage=result_storage, cache_result_in_memory=False)
+    for i in range(5):
+        await store.awrite(obj=i, key=f"key-{i}")
+
+    keys = [f"key-{i}" for i in reversed(range(5))]
+    records = await store.aread_many(keys, max_concurrency=2)
+
+    assert [record.result for record in records] == [4, 3, 2, 1, 0]
+
+
+async def test_result_store_prefetch(tmp_path, monkeypatch):
+    result_storage = LocalFileSystem(basepath=tmp_path / "results")
+    writer = ResultStore(result_storage=result_storage)
+    records = [writer.create_result_record(obj=i, key=f"key-{i}") for i in range(5)]
+    for record in records:
+        await writer.apersist_result_record(record)
+
+    keys = [record.metadata.storage_key for record in records]
+    reader = ResultStore(result_storage=result_storage)
+    await reader.aprefetch(keys, max_concurrency=2)
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("The result should have been prefetched")
+
+    monkeypatch.setattr(LocalFileSystem, "read_path", fail)
+    for i, key in enumerate(keys):
+        assert (await reader.aread(key)).result == i
+
+
+async def test_result_store_prefetch_relative_keys(tmp_path, monkeypatch):
+    result_storage = LocalFileSystem(basepath=tmp_path / "results")
+    writer = ResultStore(result_storage=result_storage)
+    for i in range(3):
+        await writer.awrite(obj=i, key=f"key-{i}")
+
+    reader = ResultStore(result_storage=result_storage)
+    await reader.aprefetch([f"key-{i}" for i in range(3)])
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("The result should have been prefetched")
+
+    monkeypatch.setattr(LocalFileSystem, "read_path", fail)
+    for i in range(3):
+        assert (await reader.aread(f"key-{i}")).result == i
+
+
+async def test_result_store_prefetch_skips_missing_keys(tmp_path):
+    result_storage = LocalFileSystem(basepath=tmp_path / "results")
+    writer = ResultStore(result_storage=result_storage)
+    await writer.awrite(obj="test", key="present")
+
+    reader = ResultStore(result_storage=result_storage)
+    await reader.aprefetch(["missing", "present"])
+
+    assert (await reader.aread("present")).result == "test"
+    with pytest.raises(ValueError, match="does not exist"):
+        await reader.aread("missing")
+
+
+def test_generate_default_holder():
+    holder = ResultStore.generate_default_holder()
+    thread = threading.current_thread()
+    assert (
+        holder == f"{socket.gethostname()}:{os.getpid()}:{thread.ident}:{thread.name}"
+    )
+
+
+def test_generate_default_holder_is_unique_per_thread():
+    holders = []
+    thread = threading.Thread(
+        target=lambda: holders.append(ResultStore.generate_default_holder())
+    )
+    thread.start()
+    thread.join()
+
+    assert holders[0] != ResultStore.generate_default_holder()
+
+
+async def test_read_and_write_without_lock_manager_do_not_generate_holder(
+    tmp_path, monkeypatch
+):
+    def fail():
+        raise AssertionError("A holder should not be generated")
+
+    monkeypatch.setattr(ResultStore, "generate_default_holder", staticmethod(fail))
+    store = ResultStore(result_storage=LocalFileSystem(basepath=tmp_path))
+
+    store.write(key="sync", obj=1)
+    await store.awrite(key="async", obj=2)
+    assert store.read("sync").result == 1
+    assert (await store.aread("async")).result == 2
+
+
+@pytest.mark.parametrize("with_metadata_storage", [True, False])
+async def test_large_results_are_serialized_in_worker_thread(
+    tmp_path, monkeypatch, with_metadata_storage
+):
+    serializing_threads = []
+    dumps = PickleSerializer.dumps
+
+    def tracking_dumps(self, obj):
+        serializing_threads.append(threading.get_ident())
+        return dumps(self, obj)
+
+    monkeypatch.setattr(PickleSerializer, "dumps", tracking_dumps)
+    store = ResultStore(
+        result_storage=LocalFileSystem(basepath=tmp_path / "results"),
+        metadata_storage=(
+            LocalFileSystem(basepath=tmp_path / "metadata")
+            if with_metadata_storage
+            else None
+        ),
+        serializer=PickleSerializer(),
+    )
+
+    await store.awrite(key="small", obj=b"small")
+    await store.awrite(key="large", obj=b"x" * 1024 * 1024)
+
+    assert serializing_threads[0] == threading.get_ident()
+    assert serializing_threads[1] != threading.get_ident()
+    assert (await store.aread("large")).result == b"x" * 1024 * 1024
+
+
 async def test_supports_isolation_level():
     store_with_lock_manager = ResultStore(lock_manager=MemoryLockManager())
     store_without_lock_manager = ResultStore()
@@ -326,6 +326,27 @@ async def test_task_result_flow_run_formatted_storage_key(
     assert task_state.data.metadata.storage_key == "foo__bar"
 
 
+async def test_task_result_storage_key_with_escaped_braces(tmp_path):
+    storage = LocalFileSystem(basepath=tmp_path / "test-storage")
+    await storage.save("tmp-test-storage-escaped")
+
+    @flow
+    def foo():
+        return bar(return_state=True)
+
+    @task(
+        result_storage=storage,
+        persist_result=True,
+        result_storage_key="{{flow_run.flow_name}}-{flow_run.flow_name}",
+    )
+    def bar():
+        return 1
+
+    task_state = foo()
+    assert await task_state.result() == 1
+    assert task_state.data.metadata.storage_key == "{flow_run.flow_name}-foo"
+
+
 async def test_task_result_with_null_return(prefect_client, events_pipeline):
     @flow
     def foo():
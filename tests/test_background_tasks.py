@@ -47,8 +47,10 @@ async def clear_scheduled_task_queues():
 @pytest.fixture(autouse=True)
 async def clear_cached_filesystems():
     prefect.results._default_storages.clear()
+    prefect.results._loaded_storage_blocks.clear()
     yield
     prefect.results._default_storages.clear()
+    prefect.results._loaded_storage_blocks.clear()
 
 
 @pytest.fixture
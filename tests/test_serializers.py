@@ -1,5 +1,6 @@
 import base64
 import json
+import pickle
 import uuid
 from dataclasses import dataclass
 from unittest.mock import MagicMock
@@ -162,6 +163,14 @@ class TestPickleSerializer:
         serialized = serializer.dumps(data)
         assert serializer.loads(serialized) == data
 
+    def test_loads_blobs_with_wrapped_base64(self):
+        # Older versions wrapped the base64 encoded pickle in newlines
+        data = list(range(1000))
+        serializer = PickleSerializer(picklelib="pickle")
+        blob = base64.encodebytes(pickle.dumps(data))
+        assert b"\n" in blob
+        assert serializer.loads(blob) == data
+
     def test_picklelib_must_be_string(self):
         import pickle
 